@@ -90,15 +90,18 @@ def Functionalize_SFResults(model, results, kamodo_object=None):
     return kamodo_object
 
 
-def SFcdf_reader(filename):
+def SFcdf_reader(filename, variables=None):
     '''Loads the data from a cdf file that was written by the SFdata_tocdf
-    routine below into a nested dictionary.'''
+    routine below into a nested dictionary. variables is an optional list of
+    variable names to load; time variables and metadata are always included.
+    The default of None loads everything.'''
     from netCDF4 import Dataset
 
     cdf_data = Dataset(filename, 'r')
     cdf_dict = {key: {'units': cdf_data.variables[key].units,
                       'data': np.array(cdf_data.variables[key])}
-                for key in cdf_data.variables.keys()}
+                for key in cdf_data.variables.keys() if variables is None or
+                key in variables or 'time' in key}
     cdf_dict['metadata'] = {'model_files': cdf_data.modelfile,
                             'model_used': cdf_data.model,
                             'coord_type': cdf_data.coord_type,
@@ -128,9 +131,16 @@ def SFdata_tocdf(filename, model_filename, model_name, results_dict,
     new_dim = data_out.createDimension(time_key, results_dict[time_key].size)
     # create dimension
 
-    # copy over variables to file
+    # copy over variables to file, chunked along time and lightly compressed
+    # so re-reads (e.g. for plotting) pull fewer bytes from disk. zlib level
+    # 1 with the shuffle filter is nearly free to write and shrinks typical
+    # time series several-fold.
+    n_times = results_dict[time_key].size
+    chunks = (min(n_times, 4096),) if n_times > 0 else None
     for key in results_dict.keys():
-        new_var = data_out.createVariable(key, np.float64, (time_key))
+        new_var = data_out.createVariable(key, np.float64, (time_key),
+                                          zlib=True, complevel=1,
+                                          shuffle=True, chunksizes=chunks)
         new_var[:] = results_dict[key]  # store data in variable
         new_var.units = results_units[key]  # store units for variable
 
@@ -139,9 +149,11 @@ def SFdata_tocdf(filename, model_filename, model_name, results_dict,
     return filename
 
 
-def SFcsv_reader(filename, delimiter=','):
+def SFcsv_reader(filename, delimiter=',', variables=None):
     '''Loads the data from a csv file that was written by the SFdata_tocsv
-    routine below into a nested dict.'''
+    routine below into a nested dict. variables is an optional list of
+    variable names to load; time variables and metadata are always included.
+    The default of None loads everything.'''
 
     # open file
     from csv import reader
@@ -163,13 +175,15 @@ def SFcsv_reader(filename, delimiter=','):
     # trim [ ] off unit strings
     trimmed_units = [string[1:-1] for string in variable_units]
 
-    # create dictionary to store data in
+    # determine which columns to keep, then create dictionary to store data
+    wanted = [i for i in range(len(variable_keys)) if variables is None or
+              variable_keys[i] in variables or 'time' in variable_keys[i]]
     data_dict = {variable_keys[i]: {'units': trimmed_units[i], 'data': []}
-                 for i in range(len(variable_keys))}
+                 for i in wanted}
 
     # store data into dictionary
     for row in csv_reader:
-        for i in range(len(variable_keys)):  # skip empty block(s) at the end
+        for i in wanted:  # skips empty block(s) at the end
             data_dict[variable_keys[i]]['data'].append(row[i])
 
     # convert to numpy float arrays, except for net_idx
@@ -218,11 +232,11 @@ def SFdata_tocsv(filename, model_filename, model_name, results_dict,
     return filename
 
 
-def SFascii_reader(filename):
+def SFascii_reader(filename, variables=None):
     '''Loads the data from a csv file that was written by the SFdata_toascii
     routine below into a nested dict'''
 
-    return SFcsv_reader(filename, delimiter='\t')
+    return SFcsv_reader(filename, delimiter='\t', variables=variables)
 
 
 def SFdata_toascii(filename, model_filename, model_name, results_dict,
@@ -253,22 +267,25 @@ def SFdata_toascii(filename, model_filename, model_name, results_dict,
     return filename
 
 
-def SF_read(filename):
+def SF_read(filename, variables=None):
     '''Collect input function calls into one function.
 
     filename = string with complete filepath. The file extension must be one
         of 'nc'for a netCDF4 file, 'csv' for a comma separated file, or 'txt'
         for a tab separated file.
+    variables = an optional list of variable names to load. Time variables
+        and metadata are always included. The default of None loads
+        everything.
 
     Output: a nested dictionary containing the metadata, data, and units.'''
 
     file_type = filename.split('.')[-1]
     if file_type == 'nc':
-        traj_data = SFcdf_reader(filename)
+        traj_data = SFcdf_reader(filename, variables=variables)
     elif file_type == 'csv':
-        traj_data = SFcsv_reader(filename)
+        traj_data = SFcsv_reader(filename, variables=variables)
     elif file_type == 'txt':
-        traj_data = SFascii_reader(filename)
+        traj_data = SFascii_reader(filename, variables=variables)
     else:
         raise AttributeError('File type not recognized. Must be one of' +
                              ' cdf4, csv, or txt.')
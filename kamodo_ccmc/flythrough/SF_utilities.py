@@ -5,9 +5,10 @@ Created on Fri Apr 23 17:09:14 2021
 Most needed functions to support the SatelliteFlythrough software.
 """
 from numpy import vectorize, array, diff, where, unique
+from functools import lru_cache
 from time import perf_counter
 from datetime import datetime, timedelta
-from os.path import isfile
+from os.path import getmtime, isfile
 import kamodo_ccmc.flythrough.model_wrapper as MW
 from kamodo_ccmc.readers.reader_utilities import read_timelist
 from kamodo_ccmc.flythrough.utils import ConvertCoord
@@ -57,7 +58,10 @@ def Model_FlyAway(reader, file_dir, variable_list, sat_time, c1, c2, c3,
                            verbose=verbose)
 
     # retrieve interpolator and interpolate data for each variable, using track
-    #   type appropriate for each variable.
+    #   type appropriate for each variable. The interpolators read their
+    #   model files lazily at call time, and HDF5 builds are generally not
+    #   thread-safe, so the variables are interpolated serially; revisit if
+    #   the readers ever decouple file access from the interpolation math.
     results = {var: kamodo_object[var](sat_track[[key for key, value in
                                                   z_dependencies.items() if var
                                                   in value][0]]) for var in
@@ -191,7 +195,18 @@ def Model_SatelliteFlythrough(model, file_dir, variable_list, sat_time, c1, c2,
 def File_UTCTimes(model, file_dir):
     '''Returns the min start utc timestamp, the max end utc timestamp, and the
     datetime object containing midnight of the start date of the data. Creates
-    preprocessed files if needed.'''
+    preprocessed files if needed. The result is cached per directory so batch
+    scripts flying many trajectories through the same model run only pay for
+    the metadata scan once; the directory modification time is part of the
+    cache key, so adding or removing files invalidates the entry.'''
+
+    return _File_UTCTimes(model, file_dir, getmtime(file_dir))
+
+
+@lru_cache(maxsize=32)
+def _File_UTCTimes(model, file_dir, dir_mtime):
+    '''Cached worker for File_UTCTimes. dir_mtime is only part of the cache
+    key.'''
 
     # get times dictionary and datetime filedate object from files
     list_file = file_dir + model +'_list.txt'
@@ -20,9 +20,104 @@ Example calls from the command line:
 See ConvertCoord for details on the coordinate systems.
 """
 import numpy as np
-from os.path import isfile
-import kamodo_ccmc.flythrough.SF_output as O
-import kamodo_ccmc.flythrough.SF_utilities as U
+from os import environ
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Size the HDF5/netCDF4 chunk cache before any model file is opened. The
+# 1 MB library default thrashes when reading long time series from chunked
+# model output; 256 MB comfortably holds the working set of a flythrough
+# read. The environment variable covers libraries that size their cache at
+# open time and must be set before anything imports netCDF4; the matching
+# netCDF4.set_chunk_cache call happens lazily in _set_chunk_cache below.
+environ.setdefault('HDF5_CHUNK_CACHE_SIZE', str(256*1024*1024))
+
+# sgp4 is only needed for TLETrajectory, but importing it once here avoids
+# paying the import machinery cost on every call. It is an optional
+# dependency, so guard it to keep the rest of the module usable.
+try:
+    from sgp4.api import Satrec
+except ImportError:
+    Satrec = None
+
+# The heavy dependencies (kamodo via the SF_output/SF_utilities modules,
+# netCDF4, astropy) are imported inside the functions that need them so that
+# short invocations, e.g. the command line help paths, do not pay hundreds
+# of ms of import time up front.
+R_EARTH_KM = None  # km; resolved from astropy on first TLETrajectory call
+
+_chunk_cache_set = False
+
+
+def _set_chunk_cache():
+    '''Apply the 256 MB netCDF4 chunk cache once, before the first model
+    file is opened. A missing or older netCDF4 keeps its defaults.'''
+    global _chunk_cache_set
+    if _chunk_cache_set:
+        return
+    _chunk_cache_set = True
+    try:
+        import netCDF4
+        netCDF4.set_chunk_cache(size=256*1024*1024, nelems=4133,
+                                preemption=0.75)
+    except (ImportError, AttributeError):
+        pass
+
+# cache for the HAPI reader class; its module pulls in several heavy
+# dependencies, so it is imported once on first use instead of per call
+_HAPI = None
+
+# coordinate-string validation sets, built once for O(1) membership tests
+_TRAJ_COORD_TYPES = frozenset(('GEO', 'GSM', 'GSE', 'SM'))
+_SPH_ONLY_COORDS = frozenset(('SPH', 'RLL'))  # no cartesian grid, so no plots
+
+
+def _results_to_xarray(results, model, coord_sys):
+    '''Wrap a flythrough results dictionary in an xarray.Dataset without
+    copying the data. utc_time becomes the time coordinate, every other key
+    becomes a data variable wrapping the same underlying array, and the
+    units are attached as attributes. xarray is imported here so it stays an
+    optional dependency.'''
+    import xarray as xr
+    import kamodo_ccmc.flythrough.SF_utilities as U
+
+    coord_type, coord_grid = coord_sys.split('-')
+    var_list = [key for key in results.keys() if key not in
+                ['utc_time', 'c1', 'c2', 'c3', 'net_idx']]
+    units = U.MW.coord_units(coord_type, coord_grid)
+    if len(var_list) > 0:
+        units.update(U.MW.Var_units(model, var_list))
+    data_vars = {key: xr.DataArray(value, dims=['time'],
+                                   attrs={'units': units.get(key, '')})
+                 for key, value in results.items() if key != 'utc_time'}
+    return xr.Dataset(data_vars, coords={'time': results['utc_time']},
+                      attrs={'model': model, 'coord_type': coord_type,
+                             'coord_grid': coord_grid})
+
+
+def _to_utc_seconds(sat_time):
+    '''Coerce a trajectory time array to contiguous float64 UTC seconds
+    since 1970-01-01. numpy datetime64 arrays are converted with a single
+    vectorized epoch subtraction, sequences of datetime objects through
+    their timestamps (naive datetimes are interpreted as UTC, never local
+    time), and numeric inputs are passed through with at most a layout
+    copy.'''
+    from datetime import timezone
+
+    def _timestamp(t):
+        if not hasattr(t, 'timestamp'):
+            return float(t)
+        if t.tzinfo is None:  # all times in this package are UTC
+            t = t.replace(tzinfo=timezone.utc)
+        return t.timestamp()
+
+    arr = np.asarray(sat_time)
+    if arr.dtype.kind == 'M':  # datetime64 of any resolution
+        return (arr - np.datetime64('1970-01-01', 's')) / \
+            np.timedelta64(1, 's')
+    if arr.dtype.kind == 'O':  # datetime objects (or mixed python numbers)
+        return np.array([_timestamp(t) for t in arr])
+    return np.ascontiguousarray(arr, dtype=np.float64)
 
 
 def SatelliteTrajectory(dataset, start_ts, stop_ts, coord_type='GEO',
@@ -47,14 +142,17 @@ def SatelliteTrajectory(dataset, start_ts, stop_ts, coord_type='GEO',
     See kamodo_ccmc.flythrough.utils.ConvertCoord for info on the coordinate
     systems.
     '''
-    from kamodo_ccmc.readers.hapi import HAPI
+    import kamodo_ccmc.flythrough.SF_utilities as U
+    global _HAPI
+    if _HAPI is None:
+        from kamodo_ccmc.readers.hapi import HAPI as _HAPI
 
     # convert from utc timestamps to isoformat
     start = U.ts_to_ISOstring(start_ts)
     stop = U.ts_to_ISOstring(stop_ts)
 
     # check input coord_type
-    if coord_type not in ['GEO', 'GSM', 'GSE', 'SM']:
+    if coord_type not in _TRAJ_COORD_TYPES:
         raise AttributeError(f'Coordinate type {coord_type} not available. ' +
                              'Pick from GEO, GSM, GSE, or SM.')
     else:
@@ -62,11 +160,17 @@ def SatelliteTrajectory(dataset, start_ts, stop_ts, coord_type='GEO',
 
     # retrieve satellite trajectory
     server = 'http://hapi-server.org/servers/SSCWeb/hapi'  # for coord data
-    hapi = HAPI(server, dataset, parameters, start, stop, verbose=verbose)
+    hapi = _HAPI(server, dataset, parameters, start, stop, verbose=verbose)
+    px, py, pz = parameters.split(',')  # split once instead of three times
+    # copy the returned coordinates into one contiguous float64 buffer so
+    # downstream consumers traverse a single cache-friendly allocation
+    # regardless of what layout the HAPI reader handed back
+    xyz = np.empty((3, hapi.tsarray.shape[0]), dtype=np.float64)
+    xyz[0] = hapi.variables[px]['data']
+    xyz[1] = hapi.variables[py]['data']
+    xyz[2] = hapi.variables[pz]['data']
     satellite_dict = {'sat_time': hapi.tsarray,  # utc timestamps
-                      'c1': hapi.variables[parameters.split(',')[0]]['data'],
-                      'c2': hapi.variables[parameters.split(',')[1]]['data'],
-                      'c3': hapi.variables[parameters.split(',')[2]]['data']}
+                      'c1': xyz[0], 'c2': xyz[1], 'c3': xyz[2]}
 
     print(f'Attribute/Key names of return dictionary: {satellite_dict.keys()}')
 
@@ -108,34 +212,44 @@ def SampleTrajectory(start_time, stop_time, max_lat=65., min_lat=-65.,
     # determine number of samples per 90min orbit
     orbit_seconds = int(90. * 60. / float(n))
     n_orbits = (stop_time - start_time) / float(orbit_seconds*n)
-    h_scale, h_offset = (max_height - min_height)/2., np.mean([max_height,
-                                                               min_height])
-    lat_scale, lat_offset = (max_lat-min_lat)/2., np.mean([max_lat, min_lat])
-    time_left = (stop_time-start_time) / float(n) -\
-        int(n_orbits) * orbit_seconds
-
-    # create orbital tracks
-    pi_arr = np.linspace(0., 2.*np.pi, orbit_seconds)
-    lat = np.tile(np.cos(pi_arr), int(n_orbits))
-    height = np.tile(np.sin(pi_arr), int(n_orbits))
-    if time_left > 0:  # add partial last orbit
-        lat = np.append(lat, np.cos(pi_arr[0:int(time_left)]))
-        height = np.append(height, np.sin(pi_arr[0:int(time_left)]))
-    lon = np.linspace(0., float(lon_perorbit)*n_orbits,
-                      int((stop_time-start_time)/float(n)))
-    while max(lon) > 360.:
-        lon[np.where(lon > 360.)[0]] -= 360.
-    while max(lon) < 0.:
-        lon[np.where(lon < 0.)[0]] += 360.
-    height = height * h_scale + h_offset -\
-        np.linspace(0., p, int((stop_time-start_time)/float(n))) * min_height
+    N = int((stop_time-start_time)/float(n))  # total number of samples
+    n_full = int(n_orbits)  # number of complete orbits
+    n_filled = n_full * orbit_seconds  # samples in the complete orbits
+    h_scale, h_offset = (max_height - min_height)/2., \
+        (max_height + min_height)/2.
+    lat_scale, lat_offset = (max_lat-min_lat)/2., (max_lat + min_lat)/2.
+
+    # create orbital tracks; when numba is installed the optional kernel
+    # builds the final lon/lat/height arrays in one fused compiled loop,
+    # otherwise broadcast the repeated full orbits and the partial last
+    # orbit directly into preallocated arrays instead of reallocating full
+    # copies with np.tile and np.append
+    from kamodo_ccmc.flythrough import _traj_numba
+    if _traj_numba.HAVE_NUMBA and N > 1:
+        lon, lat, height = _traj_numba.sample_track(
+            N, orbit_seconds, float(lon_perorbit)*n_orbits/(N-1), h_scale,
+            h_offset, p*min_height/(N-1), lat_scale, lat_offset)
+    else:
+        pi_arr = np.linspace(0., 2.*np.pi, orbit_seconds)
+        cos_arr, sin_arr = np.cos(pi_arr), np.sin(pi_arr)
+        lat, height = np.empty(N), np.empty(N)
+        lat[:n_filled].reshape(n_full, orbit_seconds)[:] = cos_arr
+        height[:n_filled].reshape(n_full, orbit_seconds)[:] = sin_arr
+        lat[n_filled:] = cos_arr[:N-n_filled]  # partial last orbit
+        height[n_filled:] = sin_arr[:N-n_filled]
+        lon = np.mod(np.linspace(0., float(lon_perorbit)*n_orbits, N), 360.)
+        # fuse the scaling into in-place operations on the arrays
+        lon -= 180.
+        lat *= lat_scale
+        lat += lat_offset
+        height *= h_scale
+        height += h_offset
+        if N > 1:  # apply the precession height decrease in one pass
+            height -= (p*min_height/(N-1)) * np.arange(N)
 
     # store results in dictionary to return
-    sample_dict = {'sat_time': np.linspace(start_time, stop_time,
-                                           int((stop_time-start_time) /
-                                               float(n))),
-                   'c1': lon-180., 'c2': lat*lat_scale+lat_offset,
-                   'c3': height}
+    sample_dict = {'sat_time': np.linspace(start_time, stop_time, N),
+                   'c1': lon, 'c2': lat, 'c3': height}
 
     print(f'Attribute/Key names of return dictionary: {sample_dict.keys()}')
     print('(c1,c2,c3) = (lon, lat, alt) in (deg,deg,km) in the GDZ, sph ' +
@@ -143,6 +257,20 @@ def SampleTrajectory(start_time, stop_time, max_lat=65., min_lat=-65.,
     return sample_dict, 'GDZ-sph'
 
 
+def _tle_epochs_to_ts(yy, doy):
+    '''Convert TLE epoch fields to UTC timestamps without building a datetime
+    object per TLE. yy is an integer array of two-digit epoch years (57-99
+    map to the 1900s, 0-56 to the 2000s) and doy is a float array of
+    fractional days of year (day 1 = Jan 1). Returns an int64 array of
+    seconds since 1970-01-01.'''
+
+    year = np.where(yy >= 57, 1900 + yy, 2000 + yy)
+    # days from 1970-01-01 to Jan 1 of each year (Gregorian leap year rule)
+    y = year - 1
+    days = 365*(year - 1970) + (y//4 - 492) - (y//100 - 19) + (y//400 - 4)
+    return np.rint((days + doy - 1.)*86400.).astype(np.int64)
+
+
 def TLETrajectory(tle_file, start_utcts, stop_utcts, time_cadence,
                   method='forward', verbose=False):
     '''Use sgp4 to calculate a satellite trajectory given TLEs.
@@ -175,10 +303,14 @@ def TLETrajectory(tle_file, start_utcts, stop_utcts, time_cadence,
         kamodo_ccmc.flythrough.utils.ConvertCoord for more info on the
         coordinate systems.
     '''
-    from sgp4.api import days2mdhms, Satrec
-    from pandas import to_datetime
-    from datetime import datetime, timezone
-    from astropy.constants import R_earth
+    if Satrec is None:
+        raise ImportError('TLETrajectory requires the sgp4 package (version ' +
+                          '2.0 or later for its vectorized array interface).' +
+                          ' Please install it and rerun the command.')
+    global R_EARTH_KM
+    if R_EARTH_KM is None:
+        from astropy.constants import R_earth
+        R_EARTH_KM = R_earth.value/1000.  # resolve the Quantity only once
 
     if verbose:
         print('Using the sgp4 propagator...')
@@ -196,139 +328,118 @@ def TLETrajectory(tle_file, start_utcts, stop_utcts, time_cadence,
                'c3': np.zeros(UTCtimestamps.shape, dtype=float)}
     # Keep independent or the arrays will be linked together in memory!
 
-    # Convert timestamp array to decimal Julian dates using pandas.
-    @np.vectorize
-    def UTCtstoJulianDate(UTC_ts):
-        '''Converts a UTC timestamp to a Julian date using pandas.
-        Input: UTC timestamp integer value.
-        Output: Julian date calculated by pandas.
-        '''
-
-        dt = datetime.utcfromtimestamp(UTC_ts).replace(tzinfo=timezone.utc)
-        pd_dt = to_datetime(dt)
-        return pd_dt.to_julian_date()
-    julian_dates = UTCtstoJulianDate(UTCtimestamps)
-
-    # Read in TLEs
-    tle_data = {'TLE_line1': [], 'TLE_line2': [],
-                'Element Set Epoch (UTC)': []}
+    # Convert timestamp array to decimal Julian dates. UTC timestamps are
+    # POSIX seconds, so the Julian date is a simple affine transform
+    # (2440587.5 is the Julian date of 1970-01-01T00:00:00 UTC).
+    julian_dates = UTCtimestamps/86400. + 2440587.5
+    # sgp4's array interface wants the julian dates split into whole and
+    # fractional parts for improved precision.
+    jd_frac, jd_whole = np.modf(julian_dates)
+
+    # Read in TLEs. The file holds a fixed two-lines-per-record layout, so
+    # count the records first and preallocate instead of growing lists, and
+    # pull the epoch fields straight into arrays in the same read pass.
+    with open(tle_file) as file:
+        n_tle = sum(1 for line in file)//2
+    line1, line2 = [None]*n_tle, [None]*n_tle
+    yy = np.empty(n_tle, dtype=np.int64)
+    doy = np.empty(n_tle, dtype=np.float64)
     with open(tle_file) as file:
-        for line in file:
-            tle_data['TLE_line1'].append(line.strip())
-            tle_data['Element Set Epoch (UTC)'].append(line[18:32].strip())
+        for i in range(n_tle):
             line = next(file)
-            tle_data['TLE_line2'].append(line.strip())
-
-    # Calculate UTC timestamps for TLEs.
-    tmp = []
-    for item in tle_data['Element Set Epoch (UTC)']:
-        yr = int(item[0:2])
-        if yr >= 57:
-            year = 1900 + yr
-        else:
-            year = 2000 + yr
-        month, day, hr, minute, sec = days2mdhms(year, float(item[2:]))
-        ts = datetime(year, month, day, hr, minute, round(sec),
-                      tzinfo=timezone.utc).timestamp()
-        tmp.append(ts)
-    tle_data['UTC_timestamps'] = np.array(tmp, dtype=int)
+            line1[i] = line.strip()
+            yy[i] = int(line[18:20])  # two-digit Element Set Epoch year
+            doy[i] = float(line[20:32])  # fractional day of year
+            line2[i] = next(file).strip()
+    tle_data = {'TLE_line1': line1, 'TLE_line2': line2,
+                'UTC_timestamps': _tle_epochs_to_ts(yy, doy)}
+
+    # Initialize all of the Satrec instances once, decoupling the
+    # Python-bridged twoline2rv parsing from the segment propagation loop.
+    sats = [Satrec.twoline2rv(l1, l2) for l1, l2 in zip(line1, line2)]
     if verbose:
         print('TLE data:')
         for key in tle_data.keys():
             print(key, tle_data[key])
 
-    # If nearest propagation method chosen, prepare timestamp assignments
+    # If nearest propagation method chosen, prepare timestamp assignments.
+    # The TLE timestamps are monotonic, so the nearest TLE for each timestamp
+    # is one of the two neighbors found by a binary search. This avoids
+    # materializing an (n_tles, n_times) distance matrix.
     if method == 'nearest':
-        ts_nearest = np.zeros((len(tle_data['UTC_timestamps']),
-                               len(UTCtimestamps)), dtype=int)
-        for i in range(len(tle_data['UTC_timestamps'])):
-            ts_nearest[i, :] = abs(UTCtimestamps -
-                                   tle_data['UTC_timestamps'][i])
-        ts_assignments = np.argmin(ts_nearest, axis=0)
-
-    # Assign timestamps to TLE indices
-    for i in range(len(tle_data['UTC_timestamps'])+1):
-        # Determine relevant timestamps in user array
-        if method == 'forward':  # default method typically used in forecasting
-            if i == 0:  # all timestamps before first TLE, propagate backwards
-                idx = np.where(UTCtimestamps <
-                               tle_data['UTC_timestamps'][i])[0]
-                if len(idx) > 0:
-                    tle_idx = 0
-                    test_diff = abs(UTCtimestamps[idx] -
-                                    tle_data['UTC_timestamps'][i])
-                    diff_idx = np.where(test_diff > 86400)[0]
-                    if len(diff_idx) > 0:
-                        print(f'Caution: {len(diff_idx)} times are more than' +
-                              ' 24 hrs before the first TLE.')
-                else:
-                    if verbose:
-                        print('Skipped TLE index:', i-1)
-                    continue
-            elif i < len(tle_data['UTC_timestamps']):  # propagate forwards
-                idx = np.where((UTCtimestamps >=
-                                tle_data['UTC_timestamps'][i-1]) &
-                               (UTCtimestamps <
-                                tle_data['UTC_timestamps'][i]))[0]
-                tle_idx = i-1
-                if len(idx) < 1:
-                    if verbose:
-                        print('Skipped TLE index:', i-1)
-                    continue
-            elif i == len(tle_data['UTC_timestamps']):  # propagate forwards
-                idx = np.where(UTCtimestamps >=
-                               tle_data['UTC_timestamps'][i-1])[0]
-                tle_idx = i-1  # same as last loop
-                if len(idx) > 0:
-                    test_diff = abs(UTCtimestamps[idx] -
-                                    tle_data['UTC_timestamps'][i-1])
-                    diff_idx = np.where(test_diff > 86400)[0]
-                    if len(diff_idx) > 0:
-                        print(f'Caution: {len(diff_idx)} times are more than' +
-                              ' 24 hrs after the last TLE.')
-                else:
-                    if verbose:
-                        print('Skipped TLE index:', i-1)
-                    continue
-        # more accurate method when future TLEs are known
-        elif method == 'nearest':
-            idx = np.where(ts_assignments == i)[0]
-            if len(idx) > 0:
-                tle_idx = i
-                if (i == 0) or (i == len(tle_data['UTC_timestamps'])-1):
-                    test_diff = abs(UTCtimestamps[idx] -
-                                    tle_data['UTC_timestamps'][i])
-                    diff_idx = np.where(test_diff > 86400)[0]
-                    if len(diff_idx) > 0:
-                        if i == 0:
-                            print(f'Caution: {len(diff_idx)} times are more' +
-                                  ' than 24 hrs before the first TLE.')
-                        if i == len(tle_data['UTC_timestamps'])-1:
-                            print(f'Caution: {len(diff_idx)} times are more' +
-                                  ' than 24 hrs after the last TLE.')
-            elif len(idx) < 1:
-                continue
-
-        # Initialize TLE information with chosen tle
+        tle_ts = tle_data['UTC_timestamps']
+        if len(tle_ts) == 1:
+            ts_assignments = np.zeros(len(UTCtimestamps), dtype=int)
+        else:
+            right = np.clip(np.searchsorted(tle_ts, UTCtimestamps), 1,
+                            len(tle_ts)-1)
+            left = right - 1
+            # ties go to the earlier TLE, matching argmin behavior
+            ts_assignments = np.where((UTCtimestamps - tle_ts[left]) <=
+                                      (tle_ts[right] - UTCtimestamps),
+                                      left, right)
+
+    # Assign timestamps to TLE indices. For the forward method (default
+    # method typically used in forecasting) each timestamp uses the last TLE
+    # at or before it, found for all timestamps at once with a binary search.
+    # Timestamps before the first TLE are propagated backwards from it.
+    tle_ts = tle_data['UTC_timestamps']
+    if method == 'forward':
+        ts_assignments = np.clip(np.searchsorted(tle_ts, UTCtimestamps,
+                                                 side='right') - 1, 0, None)
+
+    # Warn about extrapolation more than 24 hrs outside of the TLE range.
+    n_before = np.count_nonzero(tle_ts[0] - UTCtimestamps > 86400)
+    if n_before > 0:
+        print(f'Caution: {n_before} times are more than 24 hrs before the ' +
+              'first TLE.')
+    n_after = np.count_nonzero(UTCtimestamps - tle_ts[-1] > 86400)
+    if n_after > 0:
+        print(f'Caution: {n_after} times are more than 24 hrs after the ' +
+              'last TLE.')
+
+    # The timestamps are sorted, so the TLE assignments are too. Find the
+    # boundaries between runs of equal TLE indices and propagate each
+    # contiguous segment in one pass instead of rescanning the full timestamp
+    # array once per TLE.
+    bounds = np.nonzero(np.diff(ts_assignments))[0] + 1
+    starts = np.concatenate(([0], bounds))
+    ends = np.concatenate((bounds, [len(UTCtimestamps)]))
+    if verbose:
+        skipped = np.setdiff1d(np.arange(len(tle_ts)), ts_assignments)
+        if len(skipped) > 0:
+            print('Skipped TLE indices:', skipped)
+    def propagate_segment(seg_start, seg_end):
+        '''Propagate one contiguous segment of timestamps with its assigned
+        TLE and store the positions in the results arrays. Each segment
+        writes to a disjoint slice, so segments can run concurrently.'''
+
+        tle_idx = ts_assignments[seg_start]
+
+        # Select TLE information with chosen tle
         if verbose:
-            print('TLE assignment:', tle_idx, min(idx), max(idx))
-        satellite = Satrec.twoline2rv(tle_data['TLE_line1'][tle_idx],
-                                      tle_data['TLE_line2'][tle_idx])
-
-        # Calculate position vector for each relevant timestamp
-        @np.vectorize
-        def calc_position(jd, satellite):
-            '''Use sgp4 to calculate the position vector for a given julian
-                date and initiliazed satellite instance.
-            Returns r, the position in km in the idiosyncratic True Equator
-            Mean Equinox (TEME) coordinate frame.'''
-            e, r, v = satellite.sgp4(jd, 0.0)
-            return r
+            print('TLE assignment:', tle_idx, seg_start, seg_end-1)
+        satellite = sats[tle_idx]
+
+        # Calculate the position vectors for all relevant timestamps at once
+        # with sgp4's vectorized array interface. r is an (N, 3) array of
+        # positions in km in the idiosyncratic True Equator Mean Equinox
+        # (TEME) coordinate frame.
+        e, r, v = satellite.sgp4_array(jd_whole[seg_start:seg_end],
+                                       jd_frac[seg_start:seg_end])
 
         # Convert to earth radii and store
-        R_earth_km = R_earth.value/1000.
-        results['c1'][idx], results['c2'][idx], results['c3'][idx] = \
-            calc_position(julian_dates[idx], satellite) / R_earth_km
+        results['c1'][seg_start:seg_end] = r[:, 0] / R_EARTH_KM
+        results['c2'][seg_start:seg_end] = r[:, 1] / R_EARTH_KM
+        results['c3'][seg_start:seg_end] = r[:, 2] / R_EARTH_KM
+
+    # sgp4_array releases the GIL inside its C loop, so independent segments
+    # scale across cores with threads. Skip the pool for a single segment.
+    if len(starts) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(starts))) as pool:
+            list(pool.map(propagate_segment, starts, ends))
+    else:
+        propagate_segment(starts[0], ends[0])
 
     return results, 'teme-car'
 
@@ -345,7 +456,8 @@ def ModelFlythrough(model, file_dir, variable_list, sat_time, c1, c2, c3,
     file_dir: complete path to where model data files are stored
     variable_list: List of standardized variable names. See model variable
         output for details. Dimensions must be at least time + 2D spatial.
-    sat_time: a numpy array of the utc timestamps
+    sat_time: a numpy array of the utc timestamps. numpy datetime64 arrays
+        and arrays of datetime objects are also accepted and converted.
     c1, c2, c3: numpy arrays of the positions correlating to the utc timestamps
         (c1, c2, c3) should be (x,y,z) in R_E for cartesian coordinates, and
         (lon, lat, radius (R_E) or altitude (km)) for spherical coordinates.
@@ -378,30 +490,40 @@ def ModelFlythrough(model, file_dir, variable_list, sat_time, c1, c2, c3,
     See kamodo_ccmc.flythrough.utils.ConvertCoord for info on the coordinate
     systems.'''
 
-    # if input types are lists, correct to be numpy arrays
-    # (important for calling from C++)
-    if isinstance(sat_time, list):
-        sat_time = np.array(sat_time)
-    if isinstance(c1, list):
-        c1 = np.array(c1)
-    if isinstance(c2, list):
-        c2 = np.array(c2)
-    if isinstance(c3, list):
-        c3 = np.array(c3)
+    import kamodo_ccmc.flythrough.SF_utilities as U
+    _set_chunk_cache()  # must precede the first model file open
+
+    # coerce inputs to contiguous float64 arrays, skipping the copy when the
+    # input already has that layout (important for calling from C++, where
+    # lists would otherwise be boxed element by element into object arrays);
+    # times additionally accept datetime64 arrays and datetime objects
+    sat_time = _to_utc_seconds(sat_time)
+    c1 = np.ascontiguousarray(c1, dtype=np.float64)
+    c2 = np.ascontiguousarray(c2, dtype=np.float64)
+    c3 = np.ascontiguousarray(c3, dtype=np.float64)
 
     # give error if unknown output type given BEFORE running flythrough
-    output_type = output_name.split('.')[-1]
-    output_typelist = ['nc', 'csv', 'txt', '']
-    if output_type not in output_typelist:
+    output_path = Path(output_name)
+    output_type = output_path.suffix[1:]  # robust against dotless filenames
+    if output_name != '' and output_type not in {'nc', 'csv', 'txt'}:
         raise AttributeError('Output extension not recognized. Must be one' +
-                             ' of ', *output_typelist)
+                             " of 'nc', 'csv', or 'txt'.")
 
     # Check if output file already exists. Break if it does.
-    if isfile(output_name):
+    if output_name != '' and output_path.exists():
         raise AttributeError(f'{output_name} already exists. ' +
                              'Please either remove the file or change the ' +
                              'output_name and then rerun the command.')
 
+    # check plot_coord variable BEFORE the flythrough since plots are
+    # generated whenever an output file is requested
+    if output_name != '' and plot_coord in _SPH_ONLY_COORDS:
+        raise AttributeError('Plots can only be requested in coordinate ' +
+                             'grids where cartesian coordinates are ' +
+                             "supported. The 'SPH' and 'RLL' coordinate " +
+                             'systems do not support cartesian grids so ' +
+                             'are not allowed.')
+
     # correct variables with 'ilev' in the name 
     new_list = [''.join([i+'_' for i in var.split('_')[:-1]])[:-1]
                 if 'ilev' in var else var for var in variable_list]
@@ -437,6 +559,7 @@ def ModelFlythrough(model, file_dir, variable_list, sat_time, c1, c2, c3,
               'inputs.')
 
     if output_name != '':
+        import kamodo_ccmc.flythrough.SF_output as O
         # retrieve list of files used in the execution
         filenames = U.MW.File_List(model, file_dir)
         # perform output type desired
@@ -446,16 +569,20 @@ def ModelFlythrough(model, file_dir, variable_list, sat_time, c1, c2, c3,
         print(f"Output saved in {output_filename}.")
         print('Generating interactive plots...')
 
-        # check plot_coord variable
-        if plot_coord in ['SPH', 'RLL']:
-            raise AttributeError('Plots can only be requested in coordinate ' +
-                                 'grids where cartesian coordinates are ' +
-                                 "supported. The 'SPH' and 'RLL' coordinate " +
-                                 'systems do not support cartesian grids so ' +
-                                 'are not allowed.')
-
         # generate and save plots without displaying
         from kamodo_ccmc.flythrough.plots import SatPlot4D
+        # convert the trajectory into the plotting coordinates once and share
+        # the result between the 3D and 1D plots of every variable. When the
+        # trajectory is already in the plotting frame (e.g. GEO-car data
+        # with the default plot_coord='GEO'), reuse the arrays as they are.
+        if plot_coord == coord_type and coord_grid == 'car':
+            plot_pos = (results['c1'], results['c2'], results['c3'],
+                        ['R_E', 'R_E', 'R_E'])
+        else:
+            from kamodo_ccmc.flythrough.utils import ConvertCoord
+            plot_pos = ConvertCoord(results['utc_time'], results['c1'],
+                                    results['c2'], results['c3'], coord_type,
+                                    coord_grid, plot_coord, 'car')
         # presentation options: all, day, hour, minute, N, orbitE, orbitM
         plot_output = output_name.split('.'+output_type)[0]  # remove extension
         for var in var_list:
@@ -463,19 +590,20 @@ def ModelFlythrough(model, file_dir, variable_list, sat_time, c1, c2, c3,
                       results['c3'], results[var], results_units[var],
                       coord_type, coord_grid, plot_coord, 'all', model,
                       body='black', divfile=plot_output+'_'+var+'_3D.html',
-                      displayplot=False)
+                      displayplot=False, plot_pos=plot_pos)
             SatPlot4D(var, results['utc_time'], results['c1'], results['c2'],
                       results['c3'], results[var], results_units[var],
                       coord_type, coord_grid, plot_coord, 'all', model,
                       type='1D', divfile=plot_output+'_'+var+'_1D.html',
-                      displayplot=False)
+                      displayplot=False, plot_pos=plot_pos)
     return results
 
 
 def FakeFlight(start_time, stop_time, model, file_dir, variable_list,
                max_lat=65., min_lat=-65., lon_perorbit=363., max_height=450.,
                min_height=400., p=0.01, n=2., verbose=False,
-               output_name='', plot_coord='GEO'):
+               output_name='', plot_coord='GEO', rechunk=False,
+               return_xarray=False):
     '''Generates a sample trajectory and then flies that trajectory through the
     model data chosen.
 
@@ -509,6 +637,14 @@ def FakeFlight(start_time, stop_time, model, file_dir, variable_list,
             Only plots in cartesian coordinates systems are supported, so 'SPH'
             and 'RLL' are not accepted. Default is 'GEO'. Astropy coordinates
             also allowed.
+        rechunk: Set to True to fly through a rechunked copy of the model
+            files (created in file_dir/_chunked/ on first use). See
+            kamodo_ccmc.flythrough.rechunk for details. Requires the nccopy
+            utility. Default is False.
+        return_xarray: Set to True to return the results as an
+            xarray.Dataset wrapping the same arrays (time as the coordinate,
+            units as attributes) instead of a dictionary. Requires the
+            xarray package. Default is False.
 
     Returns a dictionary with keys: 'utc_time', 'c1', 'c2', 'c3', and 'net_idx'
     - utc_time is an array in UTC seconds since 1970-01-01 of the generated
@@ -525,6 +661,10 @@ def FakeFlight(start_time, stop_time, model, file_dir, variable_list,
     See kamodo_ccmc.flythrough.utils.ConvertCoord for info on the coordinate
     systems.'''
 
+    if rechunk:  # fly through a flythrough-friendly copy of the model files
+        from kamodo_ccmc.flythrough.rechunk import rechunk_nc_files
+        file_dir = rechunk_nc_files(file_dir)
+
     # generate a sample satellite trajectory
     sat_dict, coord_sys = SampleTrajectory(start_time, stop_time,
                                            max_lat=max_lat, min_lat=min_lat,
@@ -540,12 +680,14 @@ def FakeFlight(start_time, stop_time, model, file_dir, variable_list,
                               coord_sys, verbose=verbose,
                               output_name=output_name,
                               plot_coord=plot_coord)
+    if return_xarray:  # wrap the same arrays in a Dataset, no copies
+        return _results_to_xarray(results, model, coord_sys)
     return results
 
 
 def RealFlight(dataset, start, stop, model, file_dir, variable_list,
                coord_type='GEO', output_name='', plot_coord='GEO',
-               verbose=False):
+               verbose=False, rechunk=False, return_xarray=False):
     '''
     Retrieves the trajectory for the satellite requested and then flies that
     trajectory through the model data requested.
@@ -569,6 +711,14 @@ def RealFlight(dataset, start, stop, model, file_dir, variable_list,
         and 'RLL' are not accepted. Default is 'GEO'. Astropy coordinates
         also allowed.
     verbose: Set to true to be overwhelmed with information.
+    rechunk: Set to True to fly through a rechunked copy of the model files
+        (created in file_dir/_chunked/ on first use). See
+        kamodo_ccmc.flythrough.rechunk for details. Requires the nccopy
+        utility. Default is False.
+    return_xarray: Set to True to return the results as an xarray.Dataset
+        wrapping the same arrays (time as the coordinate, units as
+        attributes) instead of a dictionary. Requires the xarray package.
+        Default is False.
 
     Returns a dictionary with keys: 'utc_time', 'c1', 'c2', 'c3', and 'net_idx'
         - utc_time is an array in UTC seconds since 1970-01-01 of the satellite
@@ -586,6 +736,10 @@ def RealFlight(dataset, start, stop, model, file_dir, variable_list,
     See kamodo_ccmc.flythrough.utils.ConvertCoord for info on the coordinate
     systems.'''
 
+    if rechunk:  # fly through a flythrough-friendly copy of the model files
+        from kamodo_ccmc.flythrough.rechunk import rechunk_nc_files
+        file_dir = rechunk_nc_files(file_dir)
+
     # retrieve satellite trajectory from HAPI/CDAWeb
     sat_dict, coord_sys = SatelliteTrajectory(dataset, start, stop,
                                               coord_type=coord_type,
@@ -597,12 +751,15 @@ def RealFlight(dataset, start, stop, model, file_dir, variable_list,
                               coord_sys, output_name=output_name,
                               plot_coord=plot_coord,
                               verbose=verbose)
+    if return_xarray:  # wrap the same arrays in a Dataset, no copies
+        return _results_to_xarray(results, model, coord_sys)
     return results
 
 
 def TLEFlight(tle_file, start, stop, time_cadence, model, file_dir,
               variable_list, output_name='', plot_coord='GEO',
-              method='forward', verbose=False):
+              method='forward', verbose=False, rechunk=False,
+              return_xarray=False):
     '''
     Use sgp4 to calculate a satellite trajectory given TLEs, then fly the
     trajectory through the chosen model data. If the time cadence does not
@@ -640,6 +797,14 @@ def TLEFlight(tle_file, start, stop, time_cadence, model, file_dir,
             method finds the TLE nearest to the timestamp and propagates either
             forward or backward for the timestamp.
         verbose: Set to true to be overwhelmed with information.
+        rechunk: Set to True to fly through a rechunked copy of the model
+            files (created in file_dir/_chunked/ on first use). See
+            kamodo_ccmc.flythrough.rechunk for details. Requires the nccopy
+            utility. Default is False.
+        return_xarray: Set to True to return the results as an
+            xarray.Dataset wrapping the same arrays (time as the coordinate,
+            units as attributes) instead of a dictionary. Requires the
+            xarray package. Default is False.
 
     Returns a dictionary with keys: 'utc_time', 'c1', 'c2', 'c3', and 'net_idx'
         - utc_time is an array in UTC seconds since 1970-01-01 of the satellite
@@ -657,6 +822,10 @@ def TLEFlight(tle_file, start, stop, time_cadence, model, file_dir,
     See kamodo_ccmc.flythrough.utils.ConvertCoord for info on the coordinate
     systems.'''
 
+    if rechunk:  # fly through a flythrough-friendly copy of the model files
+        from kamodo_ccmc.flythrough.rechunk import rechunk_nc_files
+        file_dir = rechunk_nc_files(file_dir)
+
     # retrieve satellite trajectory from HAPI/CDAWeb
     sat_dict, coord_sys = TLETrajectory(tle_file, start, stop, time_cadence,
                                         method=method, verbose=verbose)
@@ -666,11 +835,14 @@ def TLEFlight(tle_file, start, stop, time_cadence, model, file_dir,
                               sat_dict['c2'], sat_dict['c3'],
                               coord_sys, output_name=output_name,
                               plot_coord=plot_coord, verbose=verbose)
+    if return_xarray:  # wrap the same arrays in a Dataset, no copies
+        return _results_to_xarray(results, model, coord_sys)
     return results
 
 
 def MyFlight(traj_file, model, file_dir, variable_list, output_name='',
-             plot_coord='GEO', verbose=False):
+             plot_coord='GEO', verbose=False, rechunk=False,
+             return_xarray=False):
     '''Read in a trajectory from a file, then fly through the model data
     selected.
 
@@ -696,6 +868,14 @@ def MyFlight(traj_file, model, file_dir, variable_list, output_name='',
         and 'RLL' are not accepted. Default is 'GEO'. Astropy coordinates
         also allowed.
     verbose: Set to true to be overwhelmed with information.
+    rechunk: Set to True to fly through a rechunked copy of the model files
+        (created in file_dir/_chunked/ on first use). See
+        kamodo_ccmc.flythrough.rechunk for details. Requires the nccopy
+        utility. Default is False.
+    return_xarray: Set to True to return the results as an xarray.Dataset
+        wrapping the same arrays (time as the coordinate, units as
+        attributes) instead of a dictionary. Requires the xarray package.
+        Default is False.
 
     Returns a dictionary with keys: 'utc_time', 'c1', 'c2', 'c3', and 'net_idx'
         - utc_time is an array in UTC seconds since 1970-01-01 of the given
@@ -713,8 +893,16 @@ def MyFlight(traj_file, model, file_dir, variable_list, output_name='',
     See kamodo_ccmc.flythrough.utils.ConvertCoord for info on the coordinate
     systems.'''
 
-    # read in trajectory from file into dictionary, including metadata
-    traj_data = O.SF_read(traj_file)
+    if rechunk:  # fly through a flythrough-friendly copy of the model files
+        from kamodo_ccmc.flythrough.rechunk import rechunk_nc_files
+        file_dir = rechunk_nc_files(file_dir)
+
+    import kamodo_ccmc.flythrough.SF_output as O
+
+    # read in trajectory from file into dictionary, including metadata, but
+    # only the position columns; any flythrough results stored alongside
+    # them in the file are skipped instead of loaded into memory
+    traj_data = O.SF_read(traj_file, variables=['c1', 'c2', 'c3'])
 
     # figure out key for time data
     for key in traj_data:
@@ -732,6 +920,8 @@ def MyFlight(traj_file, model, file_dir, variable_list, output_name='',
                               output_name=output_name, plot_coord=plot_coord,
                               verbose=verbose)
 
+    if return_xarray:  # wrap the same arrays in a Dataset, no copies
+        return _results_to_xarray(results, model, coord_sys)
     return results
 
 
@@ -739,155 +929,98 @@ def MyFlight(traj_file, model, file_dir, variable_list, output_name='',
 # these calls require all variables be given
 if __name__ == '__main__':
     from sys import argv
+    from argparse import ArgumentParser
+    from re import compile as re_compile
+
+    # strip quotes, brackets, and whitespace from a variable_list string in
+    # one compiled pass instead of chained str.replace copies
+    _VARLIST_STRIP = re_compile(r"""["'\[\]\s]""")
+
+    def _model(string):
+        '''Model names one character long are the integer model codes.'''
+        return int(string) if len(string) == 1 else string
+
+    def _variables(string):
+        '''Convert a "['rho','N_n']" style string into a list of names.'''
+        return [var for var in
+                _VARLIST_STRIP.sub('', string).split(',') if var]
+
+    def _make_parser(name, arguments):
+        '''Build a parser with one positional argument per (name, type) pair,
+        named to match the flight function parameters so the parsed namespace
+        can be passed through as keyword arguments.'''
+        parser = ArgumentParser(prog=name)
+        for arg_name, arg_type in arguments:
+            parser.add_argument(arg_name, type=arg_type)
+        return parser
+
+    # one parser per call type, built once, replacing the per-branch chains
+    # of manual casts and string mangling
+    PARSERS = {
+        'FakeFlight': _make_parser('FakeFlight', [
+            ('start_time', int), ('stop_time', int), ('model', _model),
+            ('file_dir', str), ('variable_list', _variables),
+            ('max_lat', float), ('min_lat', float), ('lon_perorbit', float),
+            ('max_height', float), ('min_height', float), ('p', float),
+            ('n', float), ('output_name', str), ('plot_coord', str)]),
+        'RealFlight': _make_parser('RealFlight', [
+            ('dataset', str), ('start', int), ('stop', int),
+            ('model', _model), ('file_dir', str),
+            ('variable_list', _variables), ('coord_type', str),
+            ('output_name', str), ('plot_coord', str)]),
+        'TLEFlight': _make_parser('TLEFlight', [
+            ('tle_file', str), ('start', int), ('stop', int),
+            ('time_cadence', int), ('model', _model), ('file_dir', str),
+            ('variable_list', _variables), ('output_name', str),
+            ('plot_coord', str), ('method', str)]),
+        'MyFlight': _make_parser('MyFlight', [
+            ('traj_file', str), ('model', _model), ('file_dir', str),
+            ('variable_list', _variables), ('output_name', str),
+            ('plot_coord', str)])}
+    DISPATCH = {'FakeFlight': FakeFlight, 'RealFlight': RealFlight,
+                'TLEFlight': TLEFlight, 'MyFlight': MyFlight}
+
+    _HELP_CACHE = {}
+
+    def _cached_help(func):
+        '''Render a function's help text through pydoc once and reuse the
+        string on repeat requests, skipping pydoc's full documentation
+        machinery and the interactive pager.'''
+        import pydoc
+        key = func.__qualname__
+        if key not in _HELP_CACHE:
+            _HELP_CACHE[key] = pydoc.render_doc(func,
+                                                renderer=pydoc.plaintext)
+        print(_HELP_CACHE[key])
 
     # print info if called without arguments
+    # kamodo_ccmc.flythrough.SF_utilities is imported per branch so that the
+    # help paths do not pay for the kamodo import it triggers
     if len(argv) == 2:
-        if argv[1] == 'FakeFlight':
-            help(FakeFlight)
-        elif argv[1] == 'RealFlight':
-            help(RealFlight)
-        elif argv[1] == 'TLEFlight':
-            help(TLEFlight)
-        elif argv[1] == 'MyFlight':
-            help(MyFlight)
+        if argv[1] in DISPATCH:
+            _cached_help(DISPATCH[argv[1]])
         else:
+            import kamodo_ccmc.flythrough.SF_utilities as U
             U.MW.Model_Variables(argv[1])
     elif len(argv) == 4:
-        search_str = argv[1]
-        model = argv[2]
-        file_dir = argv[3]
+        import kamodo_ccmc.flythrough.SF_utilities as U
+        search_str, model, file_dir = argv[1], argv[2], argv[3]
         U.MW.Variable_Search(search_string=search_str, model=model,
                              file_dir=file_dir)
     elif len(argv) > 7:
-        if argv[1] == 'FakeFlight':  # gather variables and call FakeFlight
-            start_time = int(argv[2])
-            stop_time = int(argv[3])
-            if len(argv[4]) == 1:
-                model = int(argv[4])
-            else:
-                model = argv[4]
-            file_dir = argv[5]
-            temp_str = argv[6][1:-1].replace("'",
-                                             "").replace(' ',
-                                                         '').replace('"', '')
-            variable_list = temp_str.split(',')   # ['rho','N_n']
-            max_lat = float(argv[7])
-            min_lat = float(argv[8])
-            lon_perorbit = float(argv[9])
-            max_height = float(argv[10])
-            min_height = float(argv[11])
-            p = float(argv[12])
-            n = float(argv[13])
-            output_name = argv[14]
-            plot_coord = argv[15]
+        if argv[1] in PARSERS:  # gather variables and call the flight
+            args = vars(PARSERS[argv[1]].parse_args(argv[2:]))
 
             # check input
-            print(f'\nstart_time: {start_time}, \nstop_time: {stop_time}, ' +
-                  f'\nmodel: {model}, \nfile_dir: {file_dir}, ' +
-                  f'\nvariable_list: {variable_list}, \nmax_lat: {max_lat}, ' +
-                  f'\nmin_lat: {min_lat}, \nlon_perorbit: {lon_perorbit}, ' +
-                  f'\nmax_height: {max_height}, \nmin_height {min_height}, ' +
-                  f'\np: {p}, n: {n}, \noutput_name: {output_name}, ' +
-                  f'\nplot_coord: {plot_coord}')
-
-            results = FakeFlight(start_time, stop_time, model, file_dir,
-                                 variable_list, max_lat=max_lat,
-                                 min_lat=min_lat, lon_perorbit=lon_perorbit,
-                                 max_height=max_height, min_height=min_height,
-                                 p=p, n=n, verbose=False,
-                                 output_name=output_name,
-                                 plot_coord=plot_coord)
-
-        elif argv[1] == 'RealFlight':  # gather variables and call RealFlight
-            dataset = argv[2]
-            start = int(argv[3])
-            stop = int(argv[4])
-            if len(argv[5]) == 1:
-                model = int(argv[5])
-            else:
-                model = argv[5]
-            file_dir = argv[6]
-            temp_str = argv[7][1:-1].replace("'",
-                                             "").replace(' ',
-                                                         '').replace('"', '')
-            variable_list = temp_str.split(',')   # ['rho','N_n']
-            coord_type = argv[8]
-            output_name = argv[9]
-            plot_coord = argv[10]
+            print('\n' + '\n'.join(f'{key}: {value}' for key, value in
+                                   args.items()))
 
-            # check input
-            print(f'\ndataset: {dataset}, \nstart: {start}, \nstop: {stop},' +
-                  f'\nmodel: {model}, \nfile_dir: {file_dir},' +
-                  f'\nvariable_list: {variable_list}, ' +
-                  f'\ncoord_type: {coord_type},' +
-                  f'\noutput_name: {output_name}, ' +
-                  f'\nplot_coord: {plot_coord}')
-
-            results = RealFlight(dataset, start, stop, model, file_dir,
-                                 variable_list, coord_type=coord_type,
-                                 output_name=output_name,
-                                 plot_coord=plot_coord)
-
-        elif argv[1] == 'TLEFlight':  # gather variables and call TLEFlight
-            tle_file = argv[2]
-            start = int(argv[3])
-            stop = int(argv[4])
-            time_cadence = int(argv[5])
-            if len(argv[6]) == 1:
-                model = int(argv[6])
-            else:
-                model = argv[6]
-            file_dir = argv[7]
-            temp_str = argv[8][1:-1].replace("'",
-                                             "").replace(' ',
-                                                         '').replace('"', '')
-            variable_list = temp_str.split(',')   # ['rho','N_n']
-            output_name = argv[9]
-            plot_coord = argv[10]
-            method = argv[11]
-
-            # check input
-            print(f'\ntle_file: {tle_file}, \nstart: {start}, ' +
-                  f'\nstop: {stop},' +
-                  f'\ntime_cadence: {time_cadence},' +
-                  f'\nmodel: {model}, \nfile_dir: {file_dir},' +
-                  f'\nvariable_list: {variable_list}, ' +
-                  f'\noutput_name: {output_name}, ' +
-                  f'\nplot_coord: {plot_coord}, ' +
-                  f'\nmethod: {method}\n')
-
-            results = TLEFlight(tle_file, start, stop, time_cadence,
-                                model, file_dir, variable_list,
-                                output_name=output_name,
-                                plot_coord=plot_coord, method=method)
-
-        elif argv[1] == 'MyFlight':  # gather variables and call MyFlight
-            traj_file = argv[2]
-            if len(argv[3]) == 1:
-                model = int(argv[3])
-            else:
-                model = argv[3]
-            file_dir = argv[4]
-            temp_str = argv[5][1:-1].replace("'",
-                                             "").replace(' ',
-                                                         '').replace('"', '')
-            variable_list = temp_str.split(',')   # ['rho','N_n']
-            output_name = argv[6]
-            plot_coord = argv[7]
-
-            # check inputs
-            print(f'\ntraj_file: {traj_file},' +
-                  f'\nmodel: {model}, \nfile_dir: {file_dir},' +
-                  f'\nvariable_list: {variable_list}, ' +
-                  f'\noutput_name: {output_name}, ' +
-                  f'\nplot_coord: {plot_coord}\n')
-
-            results = MyFlight(traj_file, model, file_dir, variable_list,
-                               output_name=output_name, plot_coord=plot_coord)
+            results = DISPATCH[argv[1]](**args)
         else:
             print('Call signature not recognized.')
     else:
         print('\nPossible call types (first argument): FakeFlight, ' +
               'RealFlight, TLEFlight, MyFlight')
         print('Use the call type as the first input to get call syntax.\n')
+        import kamodo_ccmc.flythrough.SF_utilities as U
         U.MW.Choose_Model('')  # asking for a list of possible models
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Optional numba-compiled kernel for the sample trajectory generator.
+
+numba is not a Kamodo dependency. When it is installed, SampleTrajectory in
+SatelliteFlythrough.py builds the synthetic orbit with the kernel below in a
+single compiled loop; otherwise the vectorized NumPy path there is used. The
+kernel is cached on disk (cache=True) so the compile cost is paid once per
+machine instead of once per session.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+HAVE_NUMBA = njit is not None
+
+
+if HAVE_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def sample_track(N, orbit_seconds, lon_step, h_scale, h_offset, h_drop,
+                     lat_scale, lat_offset):
+        '''Build the final synthetic orbit arrays for SampleTrajectory in one
+        loop, with the latitude/longitude affine transforms fused in so no
+        intermediate arrays are written.
+        N: total number of samples.
+        orbit_seconds: number of samples per 90 minute orbit.
+        lon_step: degrees of longitude between consecutive samples.
+        h_scale, h_offset: affine mapping of the sine wave onto the
+            min_height to max_height band, in km.
+        h_drop: precession height decrease per sample, in km.
+        lat_scale, lat_offset: affine mapping of the cosine wave onto the
+            min_lat to max_lat band, in degrees.
+        Returns (lon, lat, height) in GDZ-sph: lon wrapped and shifted to
+        [-180, 180), lat in degrees, height in km. Conversion into the model
+        frame deliberately stays in ConvertCoord, which wraps SpacePy's
+        validated geodetic pipeline.'''
+
+        lon = np.empty(N)
+        lat = np.empty(N)
+        height = np.empty(N)
+        phase_step = 2.*np.pi/(orbit_seconds - 1)
+        for i in range(N):
+            phase = (i % orbit_seconds)*phase_step
+            lat[i] = np.cos(phase)*lat_scale + lat_offset
+            height[i] = np.sin(phase)*h_scale + h_offset - h_drop*i
+            lon[i] = (lon_step*i) % 360. - 180.
+        return lon, lat, height
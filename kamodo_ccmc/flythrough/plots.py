@@ -18,7 +18,8 @@ from kamodo_ccmc.tools.shoreline import shoreline
 def SatPlot4D(var,time,c1,c2,c3,vard,varu,inCoordName,inCoordType,plotCoord,groupby,model,
               displayplot=True,returnfig=False,type='3D',body='black',zoom=False,divfile='',
               htmlfile='',plotCoordType1D='car',
-              vUnit='',vxName='',vx='',vyName='',vy='',vzName='',vz='',vScale=1.,vSkip=0):
+              vUnit='',vxName='',vx='',vyName='',vy='',vzName='',vz='',vScale=1.,vSkip=0,
+              plot_pos=None):
     """4D plotting for satellite trajectories using plotly by Darren De Zeeuw
     
     __Required variables__
@@ -60,6 +61,9 @@ def SatPlot4D(var,time,c1,c2,c3,vard,varu,inCoordName,inCoordType,plotCoord,grou
     vz: array of values of Z component of quiver vector
     vScale: length scale factor to quiver vectors
     vSkip: skip this number of points between displaying quiver vector
+    plot_pos: tuple of (xx,yy,zz,units) positions already converted into
+        plotCoord cartesian coordinates, to skip the ConvertCoord call when
+        plotting several variables along the same trajectory
     """
 
     REkm = (R_earth.value/1000.)
@@ -80,7 +84,10 @@ def SatPlot4D(var,time,c1,c2,c3,vard,varu,inCoordName,inCoordType,plotCoord,grou
 
     if type == "3D" or type == "3Dv" or type == "2DPN" or type == "2DPS":
         #Convert incoming coordinates into plot coordinages (cartesian)
-        xx,yy,zz,units = ConvertCoord(time,c1,c2,c3,inCoordName,inCoordType,plotCoord,'car')
+        if plot_pos is not None:  #use precomputed conversion when given
+            xx,yy,zz,units = plot_pos
+        else:
+            xx,yy,zz,units = ConvertCoord(time,c1,c2,c3,inCoordName,inCoordType,plotCoord,'car')
 
         # Create dictionary block to pass to plotting with selected options
         plot_dict=dict(
@@ -146,7 +153,10 @@ def SatPlot4D(var,time,c1,c2,c3,vard,varu,inCoordName,inCoordType,plotCoord,grou
         newCoord = False
         if type is "1D" and ( inCoordName != plotCoord or inCoordType != plotCoordType1D):
             #Convert incoming coordinates into plot coordinages (cartesian)
-            xx,yy,zz,units = ConvertCoord(time,c1,c2,c3,inCoordName,inCoordType,plotCoord,plotCoordType1D)
+            if plot_pos is not None and plotCoordType1D == 'car':
+                xx,yy,zz,units = plot_pos
+            else:
+                xx,yy,zz,units = ConvertCoord(time,c1,c2,c3,inCoordName,inCoordType,plotCoord,plotCoordType1D)
             newCoord = True
 
         # Create dictionary block to pass to plotting with selected options
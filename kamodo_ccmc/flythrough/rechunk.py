@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Rewrite NetCDF model output with chunking suited to satellite flythroughs.
+
+Flythroughs read long time series from small spatial neighborhoods, the
+worst-case access pattern for NETCDF3 or default-chunked NETCDF4 files.
+Rewriting the files once with nccopy into time-friendly chunks makes every
+later flythrough of the same directory faster. The rewritten files are placed
+in a '_chunked' subdirectory so the originals are untouched; hand that
+directory to the flythrough functions instead (the model reader recreates its
+preprocessed list/time files there on first use).
+
+Requires the nccopy utility from the netcdf-c tools to be on the path.
+"""
+from os import makedirs, scandir
+from os.path import isdir, isfile, join
+from shutil import copy2
+from subprocess import run
+
+
+def rechunk_nc_files(file_dir, chunk_spec='', deflate=0, cache='100M',
+                     verbose=False):
+    '''Rewrite the .nc files in file_dir with nccopy into file_dir/_chunked.
+
+    Inputs:
+        file_dir: complete path to where the model data files are stored.
+        chunk_spec: optional chunking specification handed to nccopy -c,
+            e.g. 'lon/4,lat/4,height/8,time/65536' (dimension names must
+            match the files). When empty, nccopy applies its default netCDF4
+            chunking, which already beats contiguous storage for the
+            time-series reads the flythrough performs.
+        deflate: deflate compression level 0-9 passed to nccopy -d
+            (default=0, no compression; shuffle is enabled when compressing).
+        cache: chunk cache size given to nccopy -h during the rewrite
+            (default='100M').
+        verbose: set to True to print one line per processed file.
+    Output: The path of the directory containing the rechunked files, ending
+        with the path separator so it can be handed directly to the
+        flythrough functions as file_dir. Files already present there are
+        not rewritten again, and non-NetCDF files are copied over unchanged.
+        The model _list.txt/_times.txt files are skipped because they contain
+        absolute paths; the model reader recreates them on first use.
+    '''
+
+    out_dir = join(file_dir, '_chunked', '')
+    if not isdir(out_dir):
+        makedirs(out_dir)
+    # scandir reuses the stat info cached on each directory entry, avoiding
+    # the per-file stat syscalls glob would issue (noticeable on networked
+    # filesystems with hundreds of model files)
+    with scandir(file_dir) as entries:
+        files = sorted((entry for entry in entries if
+                        entry.is_file(follow_symlinks=False)),
+                       key=lambda entry: entry.name)
+    for entry in files:
+        filename = entry.name
+        if filename.endswith('_list.txt') or filename.endswith('_times.txt'):
+            continue  # hold absolute paths, recreated by the reader
+        out_file = join(out_dir, filename)
+        if isfile(out_file):
+            continue  # already converted by an earlier call
+        if filename.endswith('.nc'):
+            command = ['nccopy', '-k', 'nc4', '-w', '-h', cache]
+            if deflate > 0:
+                command.extend(['-d', str(deflate), '-s'])
+            if chunk_spec != '':
+                command.extend(['-c', chunk_spec])
+            command.extend([entry.path, out_file])
+            run(command, check=True)
+            if verbose:
+                print(f'Rechunked {filename}.')
+        else:
+            copy2(entry.path, out_file)
+            if verbose:
+                print(f'Copied {filename}.')
+    return out_dir
@@ -3,6 +3,8 @@
 conv_to_array(value): Convert object into an array.
 ts_to_spacepystr(ts):  Convert from utc timestamp to datetime string.
 ts_to_spacepydt(ts): Convert from utc timestamp to a datetime object.
+cached_spacepydt(inTime): ts_to_spacepydt with a small cache of recent
+    results, reused across back-to-back conversions of the same times.
 create_spacepy(inTime, c1, c2, c3, inCoord, inType): Create a SpacePy Coords
     object and return.
 create_astropy(inTime, c1, c2, c3, inCoord, inType): Create as AstroPy SkyCoord
@@ -30,6 +32,9 @@ ConvertCoord_f(inTime,c1,c2,c3,iC1,iT1,iC2,iT2): Wrapper function for
 
 import time
 import numpy as np
+from hashlib import sha1
+from os import makedirs, remove, scandir
+from os.path import expanduser, isdir, isfile, join
 from datetime import datetime as dt
 from datetime import timezone
 import spacepy.coordinates as spc
@@ -110,19 +115,79 @@ def ts_to_spacepydt(ts):
     '''
 
 
+# Bounded on-disk cache of converted coordinates, so flying the same
+# trajectory again (e.g. against several models or variable lists) skips
+# redoing identical transforms. Caching is best-effort: any I/O problem is
+# treated as a cache miss and the conversion simply runs.
+coord_cache_dir = join(expanduser('~'), '.kamodo_cache', 'coord')
+COORD_CACHE_MAX = 100  # maximum number of cached conversions kept on disk
+COORD_CACHE_MIN_N = 1000  # only cache conversions at least this long
+
+
+def _coord_cache_file(inTime, c1, c2, c3, inCoord, inType, outCoord, outType):
+    '''Build the cache filename for the given conversion inputs.'''
+
+    key = sha1()
+    for arr in (inTime, c1, c2, c3):
+        key.update(np.ascontiguousarray(arr).tobytes())
+    key.update(f'{inCoord}-{inType}-{outCoord}-{outType}'.encode())
+    return join(coord_cache_dir, key.hexdigest() + '.npz')
+
+
+def _coord_cache_store(cache_file, x, y, z, units):
+    '''Save a finished conversion to the on-disk cache, evicting the oldest
+    entries to stay within COORD_CACHE_MAX files.'''
+
+    try:
+        if not isdir(coord_cache_dir):
+            makedirs(coord_cache_dir)
+        entries = sorted((entry.stat().st_mtime, entry.path) for entry in
+                         scandir(coord_cache_dir) if
+                         entry.name.endswith('.npz'))
+        # clamp at zero so a partially filled cache is never sliced from the
+        # end of the list (a negative bound would evict fresh entries)
+        for mtime, old_file in entries[:max(0, len(entries) -
+                                            COORD_CACHE_MAX + 1)]:
+            remove(old_file)
+        np.savez(cache_file, x=x, y=y, z=z, units=np.array(units))
+    except Exception:
+        pass  # caching is best-effort only
+
+
+# ConvertCoord is typically called several times in a row with the identical
+# time array (once per coordinate system needed by the variable list, then
+# again for plotting). Building the datetime array behind the SpacePy
+# Ticktock and AstroPy obstime is the dominant repeated setup cost, so the
+# last few converted arrays are cached, keyed on the raw timestamp bytes.
+_dt_cache = {}
+_DT_CACHE_MAX = 8
+
+
+def cached_spacepydt(inTime):
+    '''Return ts_to_spacepydt(inTime), reusing a recent identical result.'''
+
+    key = sha1(np.ascontiguousarray(inTime).tobytes()).hexdigest()
+    if key not in _dt_cache:
+        if len(_dt_cache) >= _DT_CACHE_MAX:
+            _dt_cache.pop(next(iter(_dt_cache)))  # drop the oldest entry
+        _dt_cache[key] = ts_to_spacepydt(inTime)
+    return _dt_cache[key]
+
+
 def create_spacepy(inTime, c1, c2, c3, inCoord, inType):
     '''Create a SpacePy Coords object and return.'''
 
-    # pack position arrays in desired format
+    # pack position arrays in desired format in one vectorized stack
+    # instead of building a list of python rows
     if inType == "sph":
         # Need to reorder Kamodo arrays to be consistent with spacepy
-        sat_track = [[c3[i], c2[i], c1[i]] for i in range(len(c1))]
+        sat_track = np.column_stack((c3, c2, c1))
     else:  # cartesian
-        sat_track = [[c1[i], c2[i], c3[i]] for i in range(len(c1))]
+        sat_track = np.column_stack((c1, c2, c3))
 
     # create SpacePy coordinate object
     cvals = Coords(sat_track, inCoord, inType)
-    tt = Ticktock(ts_to_spacepydt(inTime), 'UTC')  # datetime object method
+    tt = Ticktock(cached_spacepydt(inTime), 'UTC')  # datetime object method
     cvals.ticks = tt
     return cvals
 
@@ -130,7 +195,7 @@ def create_spacepy(inTime, c1, c2, c3, inCoord, inType):
 def create_astropy(inTime, c1, c2, c3, inCoord, inType):
     '''Create as AstroPy SkyCoord object and return.'''
 
-    t = ts_to_spacepydt(inTime)
+    t = cached_spacepydt(inTime)
     if inType == 'car':
         astropy_coord = SkyCoord(c1*u.Rearth, c2*u.Rearth, c3*u.Rearth,
                                  obstime=t, frame=inCoord,
@@ -210,8 +275,8 @@ def extract_spacepy(inTime, c1, c2, c3, inCoord, inType, outCoord, outType,
                 idx2 = np.where(c2 > 90.)[0]  # check for lat>90 after offset
                 if len(idx2) > 0:
                     c2[idx2] -= 0.000000002  # correct in other direction
-                sat_track_idx = [[c3[idx[i]], c2[idx[i]], c1[idx[i]]] for i in
-                                 range(len(idx))]  # make new sat_track
+                sat_track_idx = np.column_stack(
+                    (c3[idx], c2[idx], c1[idx]))  # make new sat_track
                 cvals_idx = Coords(sat_track_idx, inCoord, inType)
                 tt_idx = Ticktock(ts_to_spacepydt(inTime[idx]), 'UTC')
                 cvals_idx.ticks = tt_idx
@@ -311,6 +376,11 @@ def ConvertCoord(inTime, c1, c2, c3, inCoord, inType, outCoord, outType,
                                                     or ['R_E','R_E','R_E'])
     *SpacePy's GDZ car coordinate system requires and produces (x, y, z) in km.
 
+    Conversions of COORD_CACHE_MIN_N (default 1000) or more positions are
+        cached on disk under ~/.kamodo_cache/coord/ (at most COORD_CACHE_MAX
+        entries), so flying an identical trajectory again reuses the stored
+        result instead of redoing the transform.
+
     The resource information on SpacePy's coordinate conversion function is
         sparse at best, so the below information has been collected via other
         resources and our own testing of the function. The data concerning the
@@ -421,6 +491,21 @@ def ConvertCoord(inTime, c1, c2, c3, inCoord, inType, outCoord, outType,
         if verbose:
             print(f'Elapsed time: {toc-tic:.4f} seconds.')
         return c1, c2, c3, units
+    # check the on-disk cache for an identical previous conversion
+    cache_file = ''
+    if len(c1) >= COORD_CACHE_MIN_N:
+        cache_file = _coord_cache_file(inTime, c1, c2, c3, inCoord, inType,
+                                       outCoord, outType)
+        try:
+            if isfile(cache_file):
+                cached = np.load(cache_file)
+                units = [str(unit) for unit in cached['units']]
+                if verbose:
+                    print(f'Reusing cached {outCoord+outType} conversion.')
+                return cached['x'], cached['y'], cached['z'], units
+        except Exception:
+            pass  # treat unreadable cache entries as misses
+
     if len(c1) > 10000 or verbose:
         print(f'Converting {len(c1)} positions into {outCoord+outType} ' +
               'coordinates...', end="")
@@ -448,6 +533,10 @@ def ConvertCoord(inTime, c1, c2, c3, inCoord, inType, outCoord, outType,
     elif outCoord in astropy_coordlist:
         x, y, z, units = extract_astropy(new_coord, outType)
 
+    # store the finished conversion for reuse on repeat trajectories
+    if cache_file != '':
+        _coord_cache_store(cache_file, x, y, z, units)
+
     # Ending messages and final return.
     toc = time.perf_counter()
     if len(c1) > 10000 or verbose: